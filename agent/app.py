@@ -1,15 +1,21 @@
 import asyncio
 import json
+import logging
 import os
+import sys
 from dotenv import load_dotenv
 
-from agent.clients.custom_mcp_client import CustomMCPClient
+from agent.clients.custom_mcp_client import CustomMCPClient, shutdown_all
 from agent.clients.mcp_client import MCPClient
 from agent.clients.dial_client import DialClient
 from agent.models.message import Message, Role
 
 load_dotenv()
 
+# MCP clients trace connections and tool calls at DEBUG level, set AGENT_LOG_LEVEL=DEBUG to show them in console
+logging.basicConfig(format="    %(message)s", stream=sys.stdout)
+logging.getLogger("agent").setLevel((os.getenv("AGENT_LOG_LEVEL") or "WARNING").upper())
+
 async def _collect_tools(
         client: MCPClient | CustomMCPClient,
         tools: list[dict],
@@ -77,6 +83,7 @@ async def main():
             await ums_mcp_client.close()
         if fetch_mcp_client:
             await fetch_mcp_client.close()
+        await shutdown_all()
 
 
 if __name__ == "__main__":
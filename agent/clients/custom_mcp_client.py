@@ -1,11 +1,71 @@
-import json
-import uuid
+import asyncio
+import itertools
+import logging
 from typing import Optional, Any
 import aiohttp
+import orjson
 
 
+log = logging.getLogger(__name__)
+
 MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
 
+# HTTP sessions shared by CustomMCPClient instances to reuse TCP/TLS connections. A session is bound to the event
+# loop it was created on, so sessions are keyed by (event loop, `verify_ssl`) and reference-counted by clients:
+# the last client's `close()` closes the session.
+_SessionKey = tuple[asyncio.AbstractEventLoop, bool]
+_SESSIONS: dict[_SessionKey, aiohttp.ClientSession] = {}
+_SESSION_CLIENTS: dict[_SessionKey, int] = {}
+
+
+def _acquire_shared_session(verify_ssl: bool) -> tuple[_SessionKey, aiohttp.ClientSession]:
+    """Get (lazily create) HTTP session shared on the running event loop for given `verify_ssl` mode"""
+    # Sessions of already closed loops can't be used (nor closed) anymore
+    for stale_key in [key for key in _SESSIONS if key[0].is_closed()]:
+        del _SESSIONS[stale_key]
+        del _SESSION_CLIENTS[stale_key]
+
+    key = (asyncio.get_running_loop(), verify_ssl)
+    session = _SESSIONS.get(key)
+    if session is None or session.closed:
+        timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+            ssl=verify_ssl,
+        )
+        session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        _SESSIONS[key] = session
+        _SESSION_CLIENTS[key] = 0
+    _SESSION_CLIENTS[key] += 1
+    return key, session
+
+
+async def _release_shared_session(key: _SessionKey, session: aiohttp.ClientSession) -> None:
+    """Release client's reference to shared HTTP session and close it when no clients are left"""
+    if _SESSIONS.get(key) is not session:
+        # Already closed by `shutdown_all` (and possibly replaced by a newer session)
+        return
+    _SESSION_CLIENTS[key] -= 1
+    if _SESSION_CLIENTS[key] > 0:
+        return
+    del _SESSION_CLIENTS[key]
+    del _SESSIONS[key]
+    if not key[0].is_closed():
+        await session.close()
+
+
+async def shutdown_all() -> None:
+    """Close all shared HTTP sessions of the running event loop regardless of clients that didn't call `close()`"""
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _SESSIONS if key[0] is loop]:
+        del _SESSION_CLIENTS[key]
+        await _SESSIONS.pop(key).close()
+
+
 class CustomMCPClient:
     """Pure Python MCP client without external MCP libraries"""
 
@@ -13,7 +73,11 @@ class CustomMCPClient:
         self.server_url = mcp_server_url
         self.session_id: Optional[str] = None
         self.http_session: Optional[aiohttp.ClientSession] = None
+        self._http_session_key: Optional[_SessionKey] = None
         self.verify_ssl = verify_ssl
+        self._tools_cache: Optional[list[dict[str, Any]]] = None
+        # JSON-RPC ids only have to be unique within the session
+        self._id_counter = itertools.count(1)
 
     @classmethod
     async def create(cls, mcp_server_url: str, verify_ssl: bool = True) -> 'CustomMCPClient':
@@ -22,14 +86,19 @@ class CustomMCPClient:
         await instance.connect()
         return instance
 
-    async def _send_request(self, method: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    async def _send_request(
+            self,
+            method: str,
+            params: Optional[dict[str, Any]] = None,
+            retry_on_expired_session: bool = True
+    ) -> dict[str, Any]:
         """Send JSON-RPC request to MCP server"""
         if not self.http_session:
             raise RuntimeError("HTTP session not initialized")
 
         request_data: dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": uuid.uuid4().hex,
+            "id": next(self._id_counter),
             "method": method,
         }
         if params is not None:
@@ -43,58 +112,77 @@ class CustomMCPClient:
             headers[MCP_SESSION_ID_HEADER] = self.session_id
 
         async with self.http_session.post(
-            self.server_url, json=request_data, headers=headers
+            self.server_url, data=orjson.dumps(request_data), headers=headers
         ) as response:
-            if not self.session_id and response.headers.get(MCP_SESSION_ID_HEADER):
-                self.session_id = response.headers[MCP_SESSION_ID_HEADER]
+            session_expired = response.status == 404 and method != "initialize" and self.session_id is not None
+            if not (session_expired and retry_on_expired_session):
+                return await self._read_response(response)
+
+        # Server doesn't know our session anymore (expired or evicted): initialize new one and retry once
+        log.debug("Session %s expired, re-initializing", self.session_id)
+        await self._initialize_session()
+        return await self._send_request(method, params, retry_on_expired_session=False)
 
-            if response.status == 202:
-                return {}
+    async def _read_response(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
+        """Read JSON-RPC response (JSON or SSE) of MCP server"""
+        if not self.session_id and response.headers.get(MCP_SESSION_ID_HEADER):
+            self.session_id = response.headers[MCP_SESSION_ID_HEADER]
 
-            content_type = response.headers.get("content-type", "")
-            if "text/event-stream" in content_type.lower():
-                response_data = await self._parse_sse_response_streaming(response)
-            else:
-                response_data = await response.json()
+        if response.status == 202:
+            return {}
 
-            if "error" in response_data:
-                error = response_data["error"]
-                raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
+        content_type = response.headers.get("content-type", "").lower()
+        if "text/event-stream" in content_type:
+            response_data = await self._parse_sse_response_streaming(response)
+        elif "application/json" in content_type:
+            response_data = orjson.loads(await response.read())
+        else:
+            raise RuntimeError(f"MCP HTTP Error {response.status}: {await response.text()}")
 
-            return response_data
+        if "error" in response_data:
+            error = response_data["error"]
+            raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
 
+        return response_data
 
     async def _parse_sse_response_streaming(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
         """Parse Server-Sent Events response with streaming"""
         async for line in response.content:
-            line_str = line.decode("utf-8").strip()
-            if not line_str or line_str.startswith(":"):
+            line = line.rstrip()
+            if not line or line[:1] == b":":
                 continue
-            if line_str.startswith("data: "):
-                data_part = line_str[6:]
-                if data_part != "[DONE]":
-                    return json.loads(data_part)
+            if line.startswith(b"data: "):
+                data_part = line[6:]
+                if data_part != b"[DONE]":
+                    return orjson.loads(data_part)
         raise RuntimeError("No valid data found in SSE response")
 
     async def connect(self) -> None:
         """Connect to MCP server and initialize session"""
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ssl=self.verify_ssl)
-        self.http_session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        self._http_session_key, self.http_session = _acquire_shared_session(self.verify_ssl)
 
         try:
-            init_params = {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "clientInfo": {"name": "my-custom-mcp-client", "version": "1.0.0"},
-            }
-            init_response = await self._send_request("initialize", init_params)
-            await self._send_notification("notifications/initialized")
-            capabilities = init_response.get("result", {}).get("capabilities", {})
-            print(json.dumps(capabilities, indent=2))
+            await self._initialize_session()
         except Exception as e:
+            await self.close()
             raise RuntimeError(f"Failed to connect to MCP server: {e}") from e
 
+    async def _initialize_session(self) -> None:
+        """Initialize new MCP session (drops current session and cached tools)"""
+        self.session_id = None
+        self._tools_cache = None
+
+        init_params = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {}},
+            "clientInfo": {"name": "my-custom-mcp-client", "version": "1.0.0"},
+        }
+        init_response = await self._send_request("initialize", init_params)
+        await self._send_notification("notifications/initialized")
+        capabilities = init_response.get("result", {}).get("capabilities", {})
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("capabilities=%s", orjson.dumps(capabilities, option=orjson.OPT_INDENT_2).decode())
+
     async def _send_notification(self, method: str) -> None:
         """Send notification (no response expected)"""
         if not self.http_session:
@@ -112,11 +200,11 @@ class CustomMCPClient:
             headers[MCP_SESSION_ID_HEADER] = self.session_id
 
         async with self.http_session.post(
-            self.server_url, json=request_data, headers=headers
+            self.server_url, data=orjson.dumps(request_data), headers=headers
         ) as response:
             if response.headers.get(MCP_SESSION_ID_HEADER):
                 self.session_id = response.headers[MCP_SESSION_ID_HEADER]
-                print(f"Session ID: {self.session_id}")
+                log.debug("Session ID: %s", self.session_id)
 
     async def get_tools(self) -> list[dict[str, Any]]:
         """Get available tools from MCP server"""
@@ -125,9 +213,12 @@ class CustomMCPClient:
         if not self.session_id:
             raise RuntimeError("MCP session not initialized. Call connect() first.")
 
+        if self._tools_cache is not None:
+            return list(self._tools_cache)
+
         response = await self._send_request("tools/list")
         tools = response.get("result", {}).get("tools", [])
-        return [
+        self._tools_cache = [
             {
                 "type": "function",
                 "function": {
@@ -138,13 +229,14 @@ class CustomMCPClient:
             }
             for tool in tools
         ]
+        return list(self._tools_cache)
 
     async def call_tool(self, tool_name: str, tool_args: dict[str, Any]) -> Any:
         """Call a specific tool on the MCP server"""
         if not self.http_session:
             raise RuntimeError("MCP client not connected. Call connect() first.")
 
-        print(f"    Calling `{tool_name}` with {tool_args}")
+        log.debug("Calling `%s` with %s", tool_name, tool_args)
 
         params = {
             "name": tool_name,
@@ -155,13 +247,26 @@ class CustomMCPClient:
         if content := response.get("result", {}).get("content", []):
             if item := content[0]:
                 text_result = item.get("text", "")
-                print(f"    ⚙️: {text_result}\n")
+                log.debug("Result: %s", text_result)
                 return text_result
 
         return "Unexpected error occurred!"
 
+    async def call_tools(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call several tools concurrently over the shared HTTP session
+
+        Returns:
+            list: Results in `calls` order. A failed call doesn't cancel the others, its item is the raised exception.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(tool_name, tool_args) for tool_name, tool_args in calls),
+            return_exceptions=True
+        )
+
     async def close(self) -> None:
-        """Close HTTP session"""
-        if self.http_session:
-            await self.http_session.close()
-            self.http_session = None
+        """Release shared HTTP session (it is closed together with the last client using it)"""
+        if self._http_session_key and self.http_session:
+            key, session = self._http_session_key, self.http_session
+            self._http_session_key, self.http_session = None, None
+            await _release_shared_session(key, session)
+        self._tools_cache = None
@@ -89,33 +89,44 @@ class DialClient:
         return ai_message
 
     async def _call_tools(self, ai_message: Message, messages: list[Message]):
-        """Execute tool calls using MCP client"""
+        """Execute tool calls using MCP client (calls to the same CustomMCPClient are sent as one concurrent batch)"""
+        tool_results: dict[str, Any] = {}
+        batches: dict[CustomMCPClient, list[tuple[str, str, dict[str, Any]]]] = defaultdict(list)
+
         for tool_call in ai_message.tool_calls:
             tool_name = tool_call["function"]["name"]
-            tool_args = json.loads(tool_call["function"]["arguments"])
 
             try:
+                tool_args = json.loads(tool_call["function"]["arguments"])
                 client = self.tool_name_client_map.get(tool_name)
                 if not client:
                     raise Exception(f"Unable to call {tool_name}. MCP client not found.")
 
-                tool_result = await client.call_tool(tool_name, tool_args)
-
-                # Add tool result to history
-                messages.append(
-                    Message(
-                        role=Role.TOOL,
-                        content=str(tool_result),
-                        tool_call_id=tool_call["id"],
-                    )
-                )
+                if isinstance(client, CustomMCPClient):
+                    batches[client].append((tool_call["id"], tool_name, tool_args))
+                else:
+                    tool_results[tool_call["id"]] = await client.call_tool(tool_name, tool_args)
             except Exception as e:
-                error_msg = f"Error: {e}"
-                print(f"Error: {error_msg}")
-                messages.append(
-                    Message(
-                        role=Role.TOOL,
-                        content=error_msg,
-                        tool_call_id=tool_call["id"],
-                    )
+                tool_results[tool_call["id"]] = e
+
+        for client, batch in batches.items():
+            batch_results = await client.call_tools([(tool_name, tool_args) for _, tool_name, tool_args in batch])
+            for (tool_call_id, _, _), tool_result in zip(batch, batch_results):
+                tool_results[tool_call_id] = tool_result
+
+        # Add tool results to history in the order of tool calls
+        for tool_call in ai_message.tool_calls:
+            tool_result = tool_results[tool_call["id"]]
+            if isinstance(tool_result, BaseException):
+                content = f"Error: {tool_result}"
+                print(f"Error: {content}")
+            else:
+                content = str(tool_result)
+
+            messages.append(
+                Message(
+                    role=Role.TOOL,
+                    content=content,
+                    tool_call_id=tool_call["id"],
                 )
+            )
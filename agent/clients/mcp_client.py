@@ -1,9 +1,12 @@
+import logging
 from typing import Optional, Any
 
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.types import CallToolResult, TextContent
 
+log = logging.getLogger(__name__)
+
 
 class MCPClient:
     """Handles MCP server connection and tool execution"""
@@ -30,7 +33,8 @@ class MCPClient:
         self.session: ClientSession = await self._session_context.__aenter__()
 
         init_result = await self.session.initialize()
-        print(init_result.model_dump_json(indent=2))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("init_result=%s", init_result.model_dump_json(indent=2))
 
     async def get_tools(self) -> list[dict[str, Any]]:
         """Get available tools from MCP server"""
@@ -55,12 +59,12 @@ class MCPClient:
         if not self.session:
             raise RuntimeError("MCP client not connected. Call connect() first.")
 
-        print(f"    Calling `{tool_name}` with {tool_args}")
+        log.debug("Calling `%s` with %s", tool_name, tool_args)
 
         tool_result: CallToolResult = await self.session.call_tool(tool_name, tool_args)
         content = tool_result.content
 
-        print(f"    ⚙️: {content}\n")
+        log.debug("Result: %s", content)
 
         if isinstance(content, TextContent):
             return content.text
@@ -1,8 +1,9 @@
-import json
-from inspect import isawaitable
 from typing import Optional
-from fastapi import FastAPI, Response, Header
+import orjson
+from fastapi import APIRouter, FastAPI, Request, Response, Header
 from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import ValidationError
 import uvicorn
 
 from .services.mcp_server import MCPServer
@@ -10,9 +11,39 @@ from .models.request import MCPRequest
 from .models.response import MCPResponse, ErrorResponse
 
 MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
+# Send responses through chunked StreamingResponse instead of single pre-built body (for multi-message responses)
+STREAM_SSE_RESPONSES = False
+
+# Server-Sent Events framing
+_SSE_DATA = b"data: "
+_SSE_END = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+class ORJSONRequest(Request):
+    """Request that parses JSON body with orjson"""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that passes ORJSONRequest to endpoint"""
+
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
 
 # FastAPI app
 app = FastAPI(title="MCP Tools Server", version="1.0.0")
+router = APIRouter(route_class=ORJSONRoute)
 mcp_server = MCPServer()
 
 
@@ -21,41 +52,57 @@ def _validate_accept_header(accept_header: Optional[str]) -> bool:
     # 1. Check if `accept_header` is None or falsy, return False if so
     if not accept_header:
         return False
-    # 2. Split `accept_header` by commas and create `accept_types` list with stripped and lowercased values
-    accept_types = [t.strip().lower() for t in accept_header.split(",")]
-    # 3. Check if any type in `accept_types` contains 'application/json' and assign to `has_json`
-    has_json = any('application/json' in t for t in accept_types)
-    # 4. Check if any type in `accept_types` contains 'text/event-stream' and assign to `has_sse`
-    has_sse = any('text/event-stream' in t for t in accept_types)
-    # 5. Return `has_json and has_sse`
-    return has_json and has_sse
-
-async def _create_sse_stream(messages: list):
-    """Create Server-Sent Events stream for responses"""
-    dumps = json.dumps
-    prefix = "data: "
-    suffix = "\n\n"
+    # 2. Lowercase `accept_header` once and check it contains both 'application/json' and 'text/event-stream'
+    accept_header = accept_header.lower()
+    return "application/json" in accept_header and "text/event-stream" in accept_header
+
+def _json_response(error_response: MCPResponse, status_code: int) -> Response:
+    """Create JSON Response from MCPResponse serialized with orjson"""
+    return Response(
+        status_code=status_code,
+        content=orjson.dumps(error_response.model_dump(exclude_none=True)),
+        media_type="application/json"
+    )
+
+async def _create_sse_stream(messages: list[MCPResponse]):
+    """Create Server-Sent Events stream for responses (messages must be already awaited)"""
+    dumps = orjson.dumps
     for message in messages:
-        if isawaitable(message):
-            message = await message
-        if hasattr(message, "model_dump_json"):
-            payload = message.model_dump_json(exclude_none=True)
-        elif hasattr(message, "dict"):
-            payload = dumps(message.dict(exclude_none=True))
-        else:
-            payload = dumps(message)
-        yield (prefix + payload + suffix).encode("utf-8")
-    yield b"data: [DONE]\n\n"
+        yield _SSE_DATA + dumps(message.model_dump(exclude_none=True)) + _SSE_END
+    yield _SSE_DONE
+
+def _create_sse_body(message: MCPResponse) -> bytes:
+    """Create Server-Sent Events body for single response"""
+    return _SSE_DATA + orjson.dumps(message.model_dump(exclude_none=True)) + _SSE_END + _SSE_DONE
 
-@app.post("/mcp")
+@router.post(
+    "/mcp",
+    response_class=Response,
+    # Body is parsed manually with orjson, so declare it explicitly for OpenAPI docs
+    openapi_extra={"requestBody": {"content": {"application/json": {"schema": MCPRequest.model_json_schema()}}}}
+)
 async def handle_mcp_request(
-        request: MCPRequest,
+        http_request: Request,
         response: Response,
         accept: Optional[str] = Header(None),
         mcp_session_id: Optional[str] = Header(None, alias=MCP_SESSION_ID_HEADER)
 ):
     """Single MCP endpoint handling all JSON-RPC requests with proper session management"""
 
+    # 0. Parse body (orjson via ORJSONRequest) and validate it as MCPRequest
+    try:
+        request = MCPRequest.model_validate(await http_request.json())
+    except orjson.JSONDecodeError as e:
+        return _json_response(
+            MCPResponse(id="server-error", error=ErrorResponse(code=-32700, message=f"Parse error: {e}")),
+            status_code=400
+        )
+    except ValidationError as e:
+        return _json_response(
+            MCPResponse(id="server-error", error=ErrorResponse(code=-32600, message=f"Invalid request: {e}")),
+            status_code=400
+        )
+
     # 1. Validate Accept header:
     if not _validate_accept_header(accept):
     #       - If False, create `error_response` with MCPResponse:
@@ -65,15 +112,8 @@ async def handle_mcp_request(
             id="server-error",
             error=ErrorResponse(code=-32600, message="Client must accept both application/json and text/event-stream")
         )
-    #       - Return Response with:
-    #           - status_code=406,
-    #           - content=error_response.model_dump_json(),
-    #           - media_type="application/json"
-        return Response(
-            status_code=406,
-            content=error_response.model_dump_json(),
-            media_type="application/json"
-        )
+    #       - Return `_json_response(error_response, status_code=406)`
+        return _json_response(error_response, status_code=406)
     # 2. Handle initialization (no session required):
     #       - If `request.method == "initialize"`:
     #           - Call `mcp_server.handle_initialize(request)` and assign to `mcp_response, session_id`
@@ -88,28 +128,21 @@ async def handle_mcp_request(
     #       - Else block for non-initialize methods:
     #           - Validate `mcp_session_id` exists, if not create error_response with
     #               MCPResponse(id="server-error", error=ErrorResponse(code=-32600, message="Missing session ID"))
-    #               and return Response with:
-    #                   - status_code=400
-    #                   - content=error_response.model_dump_json()
-    #                   - media_type="application/json"
+    #               and return `_json_response(error_response, status_code=400)`
         if not mcp_session_id:
             error_response = MCPResponse(
                 id="server-error",
                 error=ErrorResponse(code=-32600, message="Missing session ID")
             )
-            return Response(
-                status_code=400,
-                content=error_response.model_dump_json(),
-                media_type="application/json"
-            )
+            return _json_response(error_response, status_code=400)
     #           - Get `session` from `mcp_server.get_session(mcp_session_id)`
         session = mcp_server.get_session(mcp_session_id)
-    #           - If no session, return Response with:
-    #               - status_code=400
+    #           - If no session (unknown, expired or evicted), return Response with:
+    #               - status_code=404 (client has to re-initialize)
     #               - content="No valid session ID provided"
         if not session:
             return Response(
-                status_code=400,
+                status_code=404,
                 content="No valid session ID provided"
             )
     #           - Handle notifications/initialized: if `request.method == "notifications/initialized"` then set
@@ -129,36 +162,42 @@ async def handle_mcp_request(
                 id="server-error",
                 error=ErrorResponse(code=-32600, message="Missing session ID")
             )
-            return Response(
-                status_code=400,
-                content=error_response.model_dump_json(),
-                media_type="application/json"
-            )
-    #           - Handle tools/list: 
-        if request.method == "tools/list":
-            mcp_response = mcp_server.handle_tools_list(request)
-    #           - Handle tools/call: 
-        elif request.method == "tools/call":
-            mcp_response = mcp_server.handle_tools_call(request)
+            return _json_response(error_response, status_code=400)
+    #           - Handle tools/call via `mcp_server._async_method_dispatch` (awaited here, before streaming)
+    #           - Handle tools/list via `mcp_server._method_dispatch`
+        if async_handler := mcp_server._async_method_dispatch.get(request.method):
+            mcp_response = await async_handler(request)
+        elif handler := mcp_server._method_dispatch.get(request.method):
+            mcp_response = handler(request)
     #           - Handle unknown methods: 
         else:
             mcp_response = MCPResponse(
                 id=request.id, 
-                error=ErrorResponse(code=-32602, message=f"Method '{request.method}' not found")
+                error=ErrorResponse(code=-32601, message=f"Method '{request.method}' not found")
                 )
-    # 4. Return StreamingResponse:
-    #       - content=_create_sse_stream([mcp_response])
-    #       - media_type="text/event-stream"
+    # 4. Return SSE response:
     #       - headers={"Cache-Control": "no-cache", "Connection": "keep-alive", MCP_SESSION_ID_HEADER: mcp_session_id}
-    return StreamingResponse(
-        content=_create_sse_stream([mcp_response]),
+    #       - If `STREAM_SSE_RESPONSES`, return StreamingResponse with content=_create_sse_stream([mcp_response])
+    #       - Otherwise return Response with pre-built content=_create_sse_body(mcp_response)
+    headers = {"Cache-Control": "no-cache",
+               "Connection": "keep-alive",
+               MCP_SESSION_ID_HEADER: mcp_session_id}
+    if STREAM_SSE_RESPONSES:
+        return StreamingResponse(
+            content=_create_sse_stream([mcp_response]),
+            media_type="text/event-stream",
+            headers=headers
+        )
+    return Response(
+        content=_create_sse_body(mcp_response),
         media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", 
-                 "Connection": "keep-alive", 
-                 MCP_SESSION_ID_HEADER: mcp_session_id}
+        headers=headers
     )
 
 
+app.include_router(router)
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "mcp_server.server:app",
@@ -1,5 +1,6 @@
-import uuid
-import asyncio
+import os
+import time
+from collections import OrderedDict
 
 from mcp_server.models.request import MCPRequest
 from mcp_server.models.response import MCPResponse, ErrorResponse
@@ -11,13 +12,19 @@ from mcp_server.tools.users.update_user_tool import UpdateUserTool
 from mcp_server.tools.users.user_client import UserClient
 
 
+_ERR_MISSING_PARAMS = ErrorResponse(code=-32602, message="Missing parameters")
+_ERR_MISSING_NAME = ErrorResponse(code=-32602, message="Missing required parameter: name")
+
+
 class MCPSession:
     """Represents an MCP session with state management"""
 
+    __slots__ = ("session_id", "ready_for_operation", "created_at", "last_activity")
+
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.ready_for_operation = False
-        self.created_at = asyncio.get_event_loop().time()
+        self.created_at = time.monotonic()
         self.last_activity = self.created_at
 
 
@@ -30,11 +37,21 @@ class MCPServer:
             "version": "1.0.0"
         }
 
-        # Session management
-        self.sessions: dict[str, MCPSession] = {}
+        # Session management: sessions are kept in LRU order (least recently active first)
+        self.sessions: OrderedDict[str, MCPSession] = OrderedDict()
+        self._session_ttl = 3600
+        self._max_sessions = 10_000
         self.tools = {}
         self._register_tools()
 
+        # Method dispatch tables for session-bound JSON-RPC methods (sync and async handlers)
+        self._method_dispatch = {
+            "tools/list": self.handle_tools_list,
+        }
+        self._async_method_dispatch = {
+            "tools/call": self.handle_tools_call,
+        }
+
     def _register_tools(self):
         """Register all available tools"""
 
@@ -51,6 +68,8 @@ class MCPServer:
         # 3. Iterate trough list and add them to `self.tools` dict where key is tool name and value is tool itself
         for tool in tools_list:
             self.tools[tool.name] = tool
+        # 4. Tools are static after registration, so build `tools/list` result once and share it (read-only) between requests
+        self._tools_list_result = {"tools": [tool.to_mcp_tool() for tool in self.tools.values()]}
 
     def _validate_protocol_version(self, client_version: str) -> str:
         """Validate and negotiate protocol version"""
@@ -59,19 +78,34 @@ class MCPServer:
             return client_version
         return self.protocol_version
 
+    def _prune_sessions(self, now: float) -> None:
+        """Evict expired sessions and least recently active ones to leave room for one more session"""
+        sessions = self.sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if len(sessions) < self._max_sessions and now - oldest.last_activity <= self._session_ttl:
+                break
+            sessions.popitem(last=False)
+
     def get_session(self, session_id: str) -> MCPSession | None:
         """Get an existing session"""
         session = self.sessions.get(session_id)
         if session:
-            session.last_activity = asyncio.get_event_loop().time()
+            now = time.monotonic()
+            if now - session.last_activity > self._session_ttl:
+                del self.sessions[session_id]
+                return None
+            session.last_activity = now
+            self.sessions.move_to_end(session_id)
         return session
 
     def handle_initialize(self, request: MCPRequest) -> tuple[MCPResponse, str]:
         """Handle initialization request with session creation"""
-        # 1. Create and assign to new `session_id` session ID as `str(uuid.uuid4()).replace("-", "")`
-        session_id = str(uuid.uuid4()).replace("-", "")
+        # 1. Create and assign to new `session_id` session ID as `os.urandom(16).hex()`
+        session_id = os.urandom(16).hex()
         # 2. Create MCPSession with `session_id` and assign to `session`
         session = MCPSession(session_id)
+        self._prune_sessions(session.created_at)
         self.sessions[session_id] = session
         # 3. Handle protocol version and assign to `protocol_version` variable:
         protocol_version = request.params.get("protocolVersion") if request.params else self.protocol_version
@@ -103,54 +137,40 @@ class MCPServer:
 
     def handle_tools_list(self, request: MCPRequest) -> MCPResponse:
         """Handle tools/list request"""
-        # 1. Create `tools_list` by iterating through `self.tools.values()` and calling `to_mcp_tool()` on each tool (via comprehension)
-        tools_list = [tool.to_mcp_tool() for tool in self.tools.values()]
-        # 2. Create MCPResponse:
+        # 1. Create MCPResponse:
         #       - id=request.id
-        #       - result={"tools": tools_list}
+        #       - result=self._tools_list_result (precomputed in `_register_tools`)
         response = MCPResponse(
             id = request.id,
-            result={"tools": tools_list}
+            result=self._tools_list_result
         )
-        # 3. Return created MCP response
+        # 2. Return created MCP response
         return response
 
     async def handle_tools_call(self, request: MCPRequest) -> MCPResponse:
         """Handle tools/call request with proper MCP-compliant response format"""
 
-        # 1. Check if `request.params` exists, if not return MCPResponse with error:
-        #       - id=request.id
-        #       - error=ErrorResponse(code=-32602, message="Missing parameters")
-        if not request.params:
-            return MCPResponse(
-                id=request.id,
-                error=ErrorResponse(code=32602, message="Missing parameters")
-            )
-        # 2. Extract `tool_name` from `request.params.get("name")` and `arguments` from `request.params.get("arguments", {})`
-        tool_name = request.params.get("name")
-        arguments = request.params.get("arguments", {})
-        # 3. Check if `tool_name` exists, if not return MCPResponse with error:
-        #       - id=request.id
-        #       - error=ErrorResponse(code=-32602, message="Missing required parameter: name")
-        if not tool_name:
-            return MCPResponse(
-                id=request.id,
-                error=ErrorResponse(code=32602, message="Missing required parameter: name")
-            )
-        # 4. Check if `tool_name` exists in `self.tools`, if not return MCPResponse with error:
-        #       - id=request.id
-        #       - error=ErrorResponse(code=-32601, message=f"Tool '{tool_name}' not found")
-        if not tool_name in self.tools:
+        # 1. Check if `request.params` exists, if not return MCPResponse with error=_ERR_MISSING_PARAMS
+        params = request.params
+        if not params:
+            return MCPResponse(id=request.id, error=_ERR_MISSING_PARAMS)
+        # 2. Extract `tool_name` from `params.get("name")` and get `tool` with single `self.tools.get(tool_name)` lookup
+        tool_name = params.get("name")
+        tool = self.tools.get(tool_name) if tool_name else None
+        # 3. If no `tool`, return MCPResponse with error:
+        #       - _ERR_MISSING_NAME if there is no `tool_name`
+        #       - otherwise ErrorResponse(code=-32601, message=f"Tool '{tool_name}' not found")
+        if tool is None:
             return MCPResponse(
                 id=request.id,
-                error=ErrorResponse(code=32601, message=f"Tool '{tool_name}' not found")
+                error=ErrorResponse(code=-32601, message=f"Tool '{tool_name}' not found") if tool_name else _ERR_MISSING_NAME
             )
-        # 5. Get `tool` from `self.tools[tool_name]`
-        tool = self.tools[tool_name]
-        # 6. Try to execute tool with arguments:
+        # 4. Extract `arguments` from `params.get("arguments")` (empty dict if missing)
+        arguments = params.get("arguments") or {}
+        # 5. Try to execute tool with arguments:
         #       - Call `await tool.execute(arguments)` and assign result to `result_text`
         #       - Return MCPResponse with id=request.id and result={"content": [{"type": "text", "text": result_text}]}
-        # 7. Handle exceptions by returning MCPResponse with:
+        # 6. Handle exceptions by returning MCPResponse with:
         #       - id=request.id
         #       - result={"content": [{"type": "text", "text": f"Tool execution error: {str(tool_error)}"}], "isError": True}
         try:
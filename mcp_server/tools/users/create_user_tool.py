@@ -3,6 +3,8 @@ from typing import Any
 from mcp_server.models.user_info import UserCreate
 from mcp_server.tools.users.base import BaseUserServiceTool
 
+_INPUT_SCHEMA = UserCreate.model_json_schema()
+
 
 class CreateUserTool(BaseUserServiceTool):
 
@@ -19,7 +21,7 @@ class CreateUserTool(BaseUserServiceTool):
     @property
     def input_schema(self) -> dict[str, Any]:
         #TProvide tool params Schema. To do that you can create json schema from UserCreate pydentic model ` UserCreate.model_json_schema()`
-        return UserCreate.model_json_schema()
+        return _INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         try:
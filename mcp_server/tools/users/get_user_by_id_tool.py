@@ -2,6 +2,17 @@ from typing import Any
 
 from mcp_server.tools.users.base import BaseUserServiceTool
 
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "number",
+            "description": "User id"
+        }
+    },
+    "required": ["id"]
+}
+
 
 class GetUserByIdTool(BaseUserServiceTool):
 
@@ -18,16 +29,7 @@ class GetUserByIdTool(BaseUserServiceTool):
     @property
     def input_schema(self) -> dict[str, Any]:
         # Provide tool params Schema. This tool applies user `id` (number) as a parameter and it is required
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "number",
-                    "description": "User id"
-                }
-            },
-            "required": ["id"]
-        }
+        return _INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         #TODO:
@@ -2,6 +2,33 @@ from typing import Any
 
 from mcp_server.tools.users.base import BaseUserServiceTool
 
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "User name"
+        },
+        "surname": {
+            "type": "string",
+            "description": "User surname"
+        },
+        "email": {
+            "type": "string",
+            "description": "User email"
+        },
+        "gender": {
+            "type": "string",
+            "description": "User gender",
+            "enum": [
+                "male",
+                "female"
+            ],
+        },
+    },
+    "required": []
+}
+
 
 class SearchUsersTool(BaseUserServiceTool):
 
@@ -23,32 +50,7 @@ class SearchUsersTool(BaseUserServiceTool):
         # - email: str
         # - gender: str
         # None of them are required (see UserClient.search_users method)
-        return {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "User name"
-                },
-                "surname": {
-                    "type": "string",
-                    "description": "User surname"
-                },
-                "email": {
-                    "type": "string",
-                    "description": "User email"
-                },
-                "gender": {
-                    "type": "string",
-                    "description": "User gender",
-                    "enum": [
-                        "male",
-                        "female"
-                    ],
-                },
-            },
-            "required": []
-        }
+        return _INPUT_SCHEMA
 
 
     async def execute(self, arguments: dict[str, Any]) -> str:
@@ -3,6 +3,18 @@ from typing import Any
 from mcp_server.models.user_info import UserUpdate
 from mcp_server.tools.users.base import BaseUserServiceTool
 
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": "number",
+            "description": "User ID that should be updated."
+        },
+        "new_info": UserUpdate.model_json_schema()
+    },
+    "required": ["id"]
+}
+
 
 class UpdateUserTool(BaseUserServiceTool):
 
@@ -21,17 +33,7 @@ class UpdateUserTool(BaseUserServiceTool):
         # Provide tool params Schema:
         # - id: number, required, User ID that should be updated.
         # - new_info: UserUpdate.model_json_schema()
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "number",
-                    "description": "User ID that should be updated."
-                },
-                "new_info": UserUpdate.model_json_schema()
-            },
-            "required": ["id"]
-        }
+        return _INPUT_SCHEMA
 
 
     async def execute(self, arguments: dict[str, Any]) -> str: